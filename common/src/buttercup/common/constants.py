@@ -16,3 +16,13 @@ CRASH_DIR_NAME = "buttercup_crashes"
 # This is fixed for every task, so we can hardcode it here
 ARCHITECTURE = _detect_architecture()
 ADDRESS_SANITIZER = "address"
+
+# Redis list of every SubmissionEntry, written by the scheduler's Submissions
+# class and read by the util CLI. Entries are never removed from the list, so
+# offsets recorded in the per-task index below stay stable.
+SUBMISSIONS_KEY = "submissions"
+
+
+def submissions_by_task_key(task_id: str) -> str:
+    """Redis key for the per-task index of submission list offsets."""
+    return f"submissions_by_task:{task_id}"
@@ -1,6 +1,6 @@
 import builtins
 import time
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from functools import lru_cache
 
@@ -86,6 +86,42 @@ class TaskRegistry:
 
         return task
 
+    def get_many(self, task_ids: Iterable[str]) -> dict[str, Task | None]:
+        """Get several tasks from the registry using a single pipelined round-trip
+
+        Each task will have its cancelled flag set according to the cancelled tasks set.
+
+        Args:
+            task_ids: The IDs of the tasks to retrieve
+
+        Returns:
+            Mapping from each requested task ID to its Task object, or None if not found
+
+        """
+        task_ids = list(task_ids)
+        if not task_ids:
+            return {}
+
+        pipe = self.redis.pipeline(transaction=False)
+        for task_id in task_ids:
+            prepared_key = self._prepare_key(task_id)
+            pipe.hget(self.hash_name, prepared_key)
+            pipe.sismember(CANCELLED_TASKS_SET, prepared_key)
+        replies = pipe.execute()
+
+        result: dict[str, Task | None] = {}
+        for idx, task_id in enumerate(task_ids):
+            task_bytes = replies[2 * idx]
+            if task_bytes is None:
+                result[task_id] = None
+                continue
+
+            task: Task = Task.FromString(task_bytes)
+            task.cancelled = bool(replies[2 * idx + 1])
+            result[task_id] = task
+
+        return result
+
     def delete(self, task_id: str) -> None:
         """Delete a task from the registry and remove it from the cancelled tasks set
 
@@ -1,20 +1,30 @@
 import json
 import logging
+import os
 import subprocess
+import sys
+import tarfile
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import Annotated
+from typing import IO, Annotated
 from uuid import uuid4
 
-from google.protobuf.text_format import Parse
+from google.protobuf.text_format import Parse, PrintMessage
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, CliPositionalArg, CliSubCommand, SettingsConfigDict, get_subcommand
 from redis import Redis
 
+from buttercup.common.constants import SUBMISSIONS_KEY, submissions_by_task_key
 from buttercup.common.datastructures.msg_pb2 import (
     BuildOutput,
     BuildType,
     SubmissionEntry,
     SubmissionResult,
+    Task,
     WeightedHarness,
 )
 from buttercup.common.logger import setup_package_logger
@@ -27,29 +37,154 @@ from buttercup.common.task_registry import TaskRegistry
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def dump_json(obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def dump_json_line(obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:
+
+    def dump_json(obj: object) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    def dump_json_line(obj: object) -> bytes:
+        return json.dumps(obj).encode() + b"\n"
+
+
 TaskId = str
 
+# Number of concurrent `kubectl cp` invocations when extracting PoVs. Each copy is
+# latency-bound (TCP+TLS+exec round-trip to the API server), so running them in
+# parallel collapses total wall time to roughly max(RTT) * ceil(N / workers).
+POV_COPY_MAX_WORKERS = 16
+
+# Number of raw submission entries fetched per LRANGE call when iterating the
+# submissions list.
+SUBMISSIONS_CHUNK_SIZE = 500
+
+
+def iter_submission_chunks(
+    redis: Redis,
+    key: str,
+    task_id: str = "",
+    chunk: int = SUBMISSIONS_CHUNK_SIZE,
+) -> Iterator[list[tuple[int, bytes]]]:
+    """Yield (list offset, raw entry) chunks from the submissions list.
+
+    Fetching the whole list with `LRANGE 0 -1` forces Redis to serialize one giant
+    reply and the client to hold every element in memory at once. Chunked reads keep
+    at most `chunk` raw entries resident and avoid stalling Redis on large lists.
+
+    When `task_id` is given and the scheduler's per-task index is populated, only
+    the offsets recorded for that task are fetched through a pipelined batch of
+    LINDEX calls, instead of downloading every submission and filtering it away
+    client-side.
+    """
+    if task_id:
+        offsets = sorted(int(offset) for offset in redis.smembers(submissions_by_task_key(task_id)))
+        if offsets:
+            # The index only covers entries pushed since the scheduler started
+            # maintaining it; entries written by an older scheduler are in the
+            # list but not in the index and would be silently skipped here
+            logger.warning(
+                f"Using per-task submission index for {task_id} ({len(offsets)} offsets); "
+                "entries predating the index are not covered, rerun without a task filter if results look incomplete"
+            )
+            for batch_start in range(0, len(offsets), chunk):
+                batch = offsets[batch_start : batch_start + chunk]
+                pipe = redis.pipeline(transaction=False)
+                for offset in batch:
+                    pipe.lindex(key, offset)
+                items = pipe.execute()
+                yield [(offset, raw) for offset, raw in zip(batch, items) if raw is not None]
+            return
+        # Index not populated (e.g. state written by an older scheduler); fall back to a full scan
+
+    start = 0
+    while True:
+        items = redis.lrange(key, start, start + chunk - 1)
+        if not items:
+            return
+        yield list(enumerate(items, start=start))
+        start += chunk
+
+
+def iter_parsed_submissions(
+    redis: Redis,
+    key: str,
+    registry: TaskRegistry,
+    task_cache: dict[str, Task | None],
+    task_id: str = "",
+) -> Iterator[tuple[int, SubmissionEntry]]:
+    """Yield (index, parsed submission) pairs from the submissions list.
+
+    Submissions are parsed one chunk at a time so that task metadata for every task
+    id referenced by the chunk can be prefetched with a single pipelined round-trip
+    (TaskRegistry.get_many) instead of one Redis round-trip per submission.
+    `task_cache` acts as the memo for those lookups, including negative results, so
+    repeat task ids never hit Redis again; callers read resolved tasks from it.
+
+    Message instances are drawn from a pool that is reused across chunks to avoid
+    allocating a fresh SubmissionEntry (plus parser state) per entry. A yielded
+    message is therefore only valid until the next chunk is parsed; callers must
+    not hold on to it across iterations.
+    """
+    message_pool: list[SubmissionEntry] = []
+    for raw_chunk in iter_submission_chunks(redis, key, task_id):
+        while len(message_pool) < len(raw_chunk):
+            message_pool.append(SubmissionEntry())
+
+        parsed: list[tuple[int, SubmissionEntry]] = []
+        for (i, raw), message in zip(raw_chunk, message_pool):
+            try:
+                message.Clear()
+                message.MergeFromString(raw)
+                parsed.append((i, message))
+            except Exception as e:
+                logger.error(f"Failed to parse submission {i}: {e}")
+
+        task_ids = {submission.crashes[0].crash.crash.target.task_id for _, submission in parsed if submission.crashes}
+        missing = task_ids.difference(task_cache)
+        if missing:
+            task_cache.update(registry.get_many(missing))
+
+        yield from parsed
+
+
+@dataclass(slots=True)
+class TaskResult:
+    """Per-task aggregation used only within read_submissions; a slotted dataclass
+    avoids pydantic validation and dict-backed storage for every task."""
 
-class TaskResult(BaseModel):
     task_id: TaskId
     project_name: str
     mode: str
     n_vulnerabilities: int = 0
     n_patches: int = 0
     n_bundles: int = 0
-    patched_vulnerabilities: list[str] = []
-    non_patched_vulnerabilities: list[str] = []
+    patched_vulnerabilities: list[str] = field(default_factory=list)
+    non_patched_vulnerabilities: list[str] = field(default_factory=list)
 
 
 def truncate_stacktraces(submission: SubmissionEntry, max_length: int = 80) -> SubmissionEntry:
     """Create a copy of the submission with truncated stacktraces for display purposes."""
-    # Create a new submission and copy the fields manually to ensure proper truncation
-    from google.protobuf import text_format
+    # Only clone the submission if at least one field actually needs truncation
+    needs_truncation = any(
+        len(crash_with_id.crash.crash.stacktrace) > max_length
+        or len(crash_with_id.crash.tracer_stacktrace) > max_length
+        or len(crash_with_id.crash.crash.crash_token) > max_length
+        for crash_with_id in submission.crashes
+    )
+    if not needs_truncation:
+        return submission
 
-    # Serialize to text and then parse back to create a proper copy
-    submission_text = text_format.MessageToString(submission)
+    # Binary copy; a text_format round-trip here would be an order of magnitude slower
     truncated_submission = SubmissionEntry()
-    text_format.Parse(submission_text, truncated_submission)
+    truncated_submission.CopyFrom(submission)
 
     # Now truncate the stacktraces and crash token
     for crash_with_id in truncated_submission.crashes:
@@ -66,21 +201,59 @@ def truncate_stacktraces(submission: SubmissionEntry, max_length: int = 80) -> S
     return truncated_submission
 
 
+def format_submission(submission: SubmissionEntry, max_token_length: int = 16) -> str:
+    """Format a compact human-readable view of a submission.
+
+    Printing a SubmissionEntry directly renders the whole message, stacktraces
+    included, through protobuf text format; this only emits the fields that matter
+    when eyeballing submissions.
+    """
+    lines = []
+    if submission.crashes:
+        lines.append(f"task_id: {submission.crashes[0].crash.crash.target.task_id}")
+    lines.append(f"stop: {submission.stop}")
+    lines.append(f"patch_idx: {submission.patch_idx}")
+    for idx, crash_with_id in enumerate(submission.crashes, start=1):
+        crash = crash_with_id.crash
+        result = SubmissionResult.Name(crash_with_id.result) if crash_with_id.result else "NONE"
+        lines.append(
+            f"crash {idx}: harness={crash.crash.harness_name} result={result} "
+            f"pov_id={crash_with_id.competition_pov_id or '-'} "
+            f"token={crash.crash.crash_token[:max_token_length]}"
+        )
+    for idx, patch_entry in enumerate(submission.patches, start=1):
+        result = SubmissionResult.Name(patch_entry.result) if patch_entry.result else "NONE"
+        lines.append(
+            f"patch {idx}: result={result} internal_id={patch_entry.internal_patch_id or '-'} "
+            f"competition_id={patch_entry.competition_patch_id or '-'} empty={not patch_entry.patch}"
+        )
+    lines.append(f"bundles: {len(submission.bundles)}")
+    return "\n".join(lines) + "\n"
+
+
+@cache
 def get_queue_names() -> list[str]:
     return [f"'{queue_name.value}'" for queue_name in QueueNames]
 
 
+@cache
 def get_build_types() -> list[str]:
     return [f"'{build_type} ({BuildType.Name(build_type)})'" for build_type in BuildType.values()]
 
 
+# Computed once at import time; the settings models below would otherwise rebuild
+# these description strings for every Field definition
+QUEUE_NAMES_DESC = "Queue name (one of " + ", ".join(get_queue_names()) + ")"
+BUILD_TYPES_DESC = "Build type (one of " + ", ".join(get_build_types()) + ")"
+
+
 class SendSettings(BaseModel):
-    queue_name: CliPositionalArg[str] = Field(description="Queue name (one of " + ", ".join(get_queue_names()) + ")")
+    queue_name: CliPositionalArg[str] = Field(description=QUEUE_NAMES_DESC)
     msg_path: CliPositionalArg[Path] = Field(description="Path to message file in Protobuf text format")
 
 
 class ReadSettings(BaseModel):
-    queue_name: CliPositionalArg[str] = Field(description="Queue name (one of " + ", ".join(get_queue_names()) + ")")
+    queue_name: CliPositionalArg[str] = Field(description=QUEUE_NAMES_DESC)
     group_name: Annotated[str | None, Field(description="Group name")] = None
 
 
@@ -94,12 +267,17 @@ class ReadHarnessWeightSettings(BaseModel):
 
 class ReadBuildsSettings(BaseModel):
     task_id: CliPositionalArg[str] = Field(description="Task ID")
-    build_type: CliPositionalArg[str] = Field(description="Build type (one of " + ", ".join(get_build_types()) + ")")
+    build_type: CliPositionalArg[str] = Field(description=BUILD_TYPES_DESC)
 
 
 class ReadSubmissionsSettings(BaseModel):
     task_id: str = Field(default="", description="Task ID")
-    verbose: bool = Field(False, description="Show full stacktraces instead of truncated versions")
+    verbose: bool = Field(
+        False, description="Dump full SubmissionEntry messages with untruncated stacktraces instead of a summary"
+    )
+    verbose_dump: bool = Field(
+        False, description="Dump full SubmissionEntry messages instead of a summary (stacktraces truncated)"
+    )
     filter_stop: bool = Field(False, description="Filter out submissions that are stopped")
 
 
@@ -112,7 +290,7 @@ class AddBuildSettings(BaseModel):
 
 
 class DeleteSettings(BaseModel):
-    queue_name: CliPositionalArg[str] = Field(description="Queue name (one of " + ", ".join(get_queue_names()) + ")")
+    queue_name: CliPositionalArg[str] = Field(description=QUEUE_NAMES_DESC)
     item_id: Annotated[str | None, Field(description="Item ID")] = None
 
 
@@ -183,6 +361,178 @@ def kubectl_cp(namespace: str, pod_name: str, remote_path: str, local_path: Path
         return False
 
 
+def make_dirs(dirs: Iterable[Path]) -> None:
+    """Create a batch of directories with one top-down sweep.
+
+    Path.mkdir(parents=True) stats every ancestor on each call; creating the batch
+    shallowest-first with bare os.mkdir keeps it to one syscall per directory.
+    Parents must either exist already or be part of the batch.
+    """
+    for path in sorted(dirs, key=lambda p: len(p.parts)):
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+
+
+def copy_povs_tar_stream(
+    namespace: str,
+    pod_name: str,
+    jobs: list[tuple[str, Path]],
+    stats: dict[str, int],
+) -> list[tuple[str, Path]]:
+    """Copy PoV files from a pod as one streamed tar archive.
+
+    A single `kubectl exec ... tar` is started with the remote paths fed on stdin
+    and its stdout stream-extracted locally, so the kubectl process startup and
+    API server round-trip are paid once instead of once per file.
+
+    Returns the jobs whose files were not present in the stream so the caller can
+    retry or record them.
+    """
+    # tar strips the leading '/' from member names
+    jobs_by_member: dict[str, list[tuple[str, Path]]] = {}
+    for remote_path, local_path in jobs:
+        jobs_by_member.setdefault(remote_path.lstrip("/"), []).append((remote_path, local_path))
+
+    proc = subprocess.Popen(
+        ["kubectl", "exec", "-i", "-n", namespace, pod_name, "--", "tar", "-czf", "-", "-T", "/dev/stdin"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert proc.stdin is not None and proc.stdout is not None and proc.stderr is not None
+
+    paths_blob = "".join(f"{remote_path}\n" for remote_path, _ in jobs).encode()
+
+    def feed_stdin() -> None:
+        try:
+            proc.stdin.write(paths_blob)  # type: ignore[union-attr]
+        except BrokenPipeError:
+            pass
+        finally:
+            proc.stdin.close()  # type: ignore[union-attr]
+
+    # Feed paths and drain stderr from separate threads so neither pipe can deadlock
+    # while we stream-extract stdout
+    stderr_chunks: list[bytes] = []
+    feeder = threading.Thread(target=feed_stdin)
+    drainer = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()))  # type: ignore[union-attr]
+    feeder.start()
+    drainer.start()
+
+    copied: set[str] = set()
+    try:
+        with tarfile.open(mode="r|gz", fileobj=proc.stdout) as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                member_jobs = jobs_by_member.get(member.name.lstrip("./").lstrip("/"))
+                if not member_jobs:
+                    logger.warning(f"Unexpected member in PoV tar stream: {member.name}")
+                    continue
+                extracted = tar.extractfile(member)
+                if extracted is None:
+                    continue
+                data = extracted.read()
+                for remote_path, local_path in member_jobs:
+                    local_path.write_bytes(data)
+                    copied.add(remote_path)
+    except tarfile.TarError as e:
+        logger.warning(f"Failed to read PoV tar stream: {e}")
+    finally:
+        feeder.join()
+        drainer.join()
+        proc.wait()
+
+    if proc.returncode != 0:
+        stderr = b"".join(stderr_chunks).decode(errors="replace").strip()
+        logger.warning(f"kubectl exec tar exited with code {proc.returncode}: {stderr}")
+
+    stats["povs_copied"] += len(copied)
+    return [(remote_path, local_path) for remote_path, local_path in jobs if remote_path not in copied]
+
+
+def _read_exact(stream: IO[bytes], n: int) -> bytes:
+    """Read exactly n bytes from a pipe, raising if it closes early."""
+    chunks: list[bytes] = []
+    while n > 0:
+        chunk = stream.read(n)
+        if not chunk:
+            raise OSError("exec session closed mid-file")
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b"".join(chunks)
+
+
+def copy_povs_exec_session(
+    namespace: str,
+    pod_name: str,
+    jobs: list[tuple[str, Path]],
+    stats: dict[str, int],
+) -> list[tuple[str, Path]]:
+    """Copy PoV files through one long-lived ``kubectl exec`` session.
+
+    A single shell loop in the pod serves every file: we write a remote path to
+    its stdin and it answers with the file size on one line followed by the raw
+    bytes (or ``-1`` if the file is unreadable). This amortizes the kubectl
+    startup and API round-trip over all files, so each copy costs only a pipe
+    round-trip instead of a fresh process spawn.
+
+    Returns the jobs that could not be copied so the caller can retry or record
+    them.
+    """
+    script = 'while IFS= read -r p; do if [ -r "$p" ]; then stat -c %s -- "$p"; cat -- "$p"; else echo -1; fi; done'
+    proc = subprocess.Popen(
+        ["kubectl", "exec", "-i", "-n", namespace, pod_name, "--", "sh", "-c", script],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert proc.stdin is not None and proc.stdout is not None and proc.stderr is not None
+
+    # Drain stderr from a thread so kubectl can't block on a full pipe while we
+    # wait on stdout (same reasoning as in copy_povs_tar_stream)
+    stderr_chunks: list[bytes] = []
+    drainer = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()))  # type: ignore[union-attr]
+    drainer.start()
+
+    missed: list[tuple[str, Path]] = []
+    copied = 0
+    next_idx = 0
+    try:
+        for next_idx, (remote_path, local_path) in enumerate(jobs, start=1):
+            proc.stdin.write(remote_path.encode() + b"\n")
+            proc.stdin.flush()
+            size = int(proc.stdout.readline())
+            if size < 0:
+                logger.warning(f"PoV file not readable in pod: {remote_path}")
+                missed.append((remote_path, local_path))
+                continue
+            local_path.write_bytes(_read_exact(proc.stdout, size))
+            copied += 1
+    except (OSError, ValueError) as e:
+        # The size/payload framing is out of sync (or the session died); the
+        # remaining jobs cannot be served by this session anymore
+        logger.warning(f"kubectl exec copy session failed after {copied} files: {e}")
+        missed.extend(jobs[next_idx - 1 :])
+    finally:
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        proc.stdout.close()
+        drainer.join()
+        proc.wait()
+
+    if proc.returncode != 0:
+        stderr = b"".join(stderr_chunks).decode(errors="replace").strip()
+        logger.warning(f"kubectl exec copy session exited with code {proc.returncode}: {stderr}")
+
+    stats["povs_copied"] += copied
+    return missed
+
+
 def extract_povs(redis: Redis, command: ExtractPovsSettings) -> None:
     """Extract PoVs, stack traces, and patches into a directory structure.
 
@@ -196,17 +546,22 @@ def extract_povs(redis: Redis, command: ExtractPovsSettings) -> None:
                                 pov.bin
                                 stacktrace.txt
                                 tracer_stacktrace.txt
-                                metadata.json
                         patches/
                             patch_001.patch
                             patch_002.patch
                         metadata.json
+                        crashes.ndjson
+                        patches.ndjson
+
+    metadata.json holds the vulnerability-level metadata; the per-crash and
+    per-patch records are appended as newline-delimited JSON to crashes.ndjson
+    and patches.ndjson, so each vulnerability costs a constant number of
+    metadata writes instead of one per crash and per patch.
     """
-    SUBMISSIONS_KEY = "submissions"
-    raw_submissions: list = redis.lrange(SUBMISSIONS_KEY, 0, -1)
     registry = TaskRegistry(redis)
 
-    if not raw_submissions:
+    n_submissions = redis.llen(SUBMISSIONS_KEY)
+    if not n_submissions:
         logger.info("No submissions found")
         return
 
@@ -221,15 +576,27 @@ def extract_povs(redis: Redis, command: ExtractPovsSettings) -> None:
     output_dir = command.output_dir.resolve()
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    logger.info(f"Found {len(raw_submissions)} submissions, extracting to {output_dir}")
+    logger.info(f"Found {n_submissions} submissions, extracting to {output_dir}")
 
     vuln_counter: dict[str, int] = {}  # task_id -> vulnerability counter
-    stats = {"povs_copied": 0, "povs_failed": 0}
+    stats = {"povs_copied": 0, "povs_failed": 0, "povs_skipped": 0}
+    stats_lock = threading.Lock()
+    pov_copy_jobs: list[tuple[str, Path]] = []  # (remote_path, local_path)
+
+    def copy_pov(remote_path: str, local_path: Path) -> None:
+        """Copy a single PoV file and record the outcome in stats."""
+        if kubectl_cp(command.namespace, pod_name, remote_path, local_path):
+            with stats_lock:
+                stats["povs_copied"] += 1
+        else:
+            with stats_lock:
+                stats["povs_failed"] += 1
+            # Store the path for reference
+            local_path.with_name("pov_path.txt").write_text(remote_path)
 
-    for i, raw in enumerate(raw_submissions):
+    task_cache: dict[str, Task | None] = {}
+    for i, submission in iter_parsed_submissions(redis, SUBMISSIONS_KEY, registry, task_cache, task_id=command.task_id):
         try:
-            submission = SubmissionEntry.FromString(raw)
-
             if submission.stop:
                 logger.debug(f"Skipping stopped submission {i}")
                 continue
@@ -253,8 +620,8 @@ def extract_povs(redis: Redis, command: ExtractPovsSettings) -> None:
                     logger.debug(f"Skipping submission {i} - no PASSED crashes")
                     continue
 
-            # Get task metadata
-            task = registry.get(task_id)
+            # Get task metadata (prefetched in bulk by iter_parsed_submissions)
+            task = task_cache.get(task_id)
             project_name = task.project_name if task else "unknown"
 
             # Create vulnerability directory
@@ -263,51 +630,60 @@ def extract_povs(redis: Redis, command: ExtractPovsSettings) -> None:
             vuln_counter[task_id] += 1
             vuln_num = vuln_counter[task_id]
 
-            vuln_dir = output_dir / project_name / task_id / f"vuln_{vuln_num:03d}"
+            task_dir = output_dir / project_name / task_id
+            vuln_dir = task_dir / f"vuln_{vuln_num:03d}"
             crashes_dir = vuln_dir / "crashes"
             patches_dir = vuln_dir / "patches"
 
-            crashes_dir.mkdir(parents=True, exist_ok=True)
-            patches_dir.mkdir(parents=True, exist_ok=True)
+            # Crash sub-directories are known up front, so create the whole
+            # subtree for this submission in a single sweep
+            crash_dirs = [crashes_dir / f"crash_{idx:03d}" for idx in range(1, len(submission.crashes) + 1)]
+            make_dirs([task_dir.parent, task_dir, vuln_dir, crashes_dir, patches_dir, *crash_dirs])
 
-            # Extract crashes
+            # Extract crashes. Bind the enum-name lookup and the nested crash
+            # messages to locals so the hot loop doesn't re-walk the same
+            # protobuf attribute chain on every access
+            result_name = SubmissionResult.Name
+            crashes_metadata = []
             for crash_idx, crash_with_id in enumerate(submission.crashes, start=1):
                 crash = crash_with_id.crash
-                crash_dir = crashes_dir / f"crash_{crash_idx:03d}"
-                crash_dir.mkdir(parents=True, exist_ok=True)
+                inner = crash.crash
+                target = inner.target
+                crash_dir = crash_dirs[crash_idx - 1]
 
-                # Copy PoV file using kubectl cp
-                pov_remote_path = crash.crash.crash_input_path
+                # Defer the PoV copy so all kubectl cp invocations can run
+                # concurrently; skip files already extracted by a previous run
                 pov_local_path = crash_dir / "pov.bin"
-
-                if kubectl_cp(command.namespace, pod_name, pov_remote_path, pov_local_path):
-                    stats["povs_copied"] += 1
+                if pov_local_path.exists() and pov_local_path.stat().st_size > 0:
+                    stats["povs_skipped"] += 1
                 else:
-                    stats["povs_failed"] += 1
-                    # Store the path for reference
-                    (crash_dir / "pov_path.txt").write_text(pov_remote_path)
-
-                # Write stacktrace
-                if crash.crash.stacktrace:
-                    (crash_dir / "stacktrace.txt").write_text(crash.crash.stacktrace)
-
-                # Write tracer stacktrace
-                if crash.tracer_stacktrace:
-                    (crash_dir / "tracer_stacktrace.txt").write_text(crash.tracer_stacktrace)
-
-                # Write crash metadata
-                crash_metadata = {
-                    "competition_pov_id": crash_with_id.competition_pov_id,
-                    "result": SubmissionResult.Name(crash_with_id.result) if crash_with_id.result else "NONE",
-                    "harness_name": crash.crash.harness_name,
-                    "crash_token": crash.crash.crash_token,
-                    "crash_input_path": crash.crash.crash_input_path,
-                    "sanitizer": crash.crash.target.sanitizer,
-                    "engine": crash.crash.target.engine,
-                }
-                (crash_dir / "metadata.json").write_text(json.dumps(crash_metadata, indent=2))
+                    pov_copy_jobs.append((inner.crash_input_path, pov_local_path))
+
+                # Write stacktraces; bind each field once so the runtime only
+                # materializes the (potentially multi-KB) Python string a single time
+                stacktrace = inner.stacktrace
+                if stacktrace:
+                    (crash_dir / "stacktrace.txt").write_text(stacktrace)
+
+                tracer_stacktrace = crash.tracer_stacktrace
+                if tracer_stacktrace:
+                    (crash_dir / "tracer_stacktrace.txt").write_text(tracer_stacktrace)
+
+                crashes_metadata.append(
+                    {
+                        "directory": crash_dir.name,
+                        "competition_pov_id": crash_with_id.competition_pov_id,
+                        "result": result_name(crash_with_id.result) if crash_with_id.result else "NONE",
+                        "harness_name": inner.harness_name,
+                        "crash_token": inner.crash_token,
+                        "crash_input_path": inner.crash_input_path,
+                        "sanitizer": target.sanitizer,
+                        "engine": target.engine,
+                    }
+                )
 
             # Extract patches (skip empty patch trackers - these are placeholders that never received content)
+            patches_metadata = []
             patch_num = 0
             for patch_entry in submission.patches:
                 if not patch_entry.patch:
@@ -316,15 +692,17 @@ def extract_povs(redis: Redis, command: ExtractPovsSettings) -> None:
                 patch_file = patches_dir / f"patch_{patch_num:03d}.patch"
                 patch_file.write_text(patch_entry.patch)
 
-                # Write patch metadata
-                patch_metadata = {
-                    "internal_patch_id": patch_entry.internal_patch_id,
-                    "competition_patch_id": patch_entry.competition_patch_id,
-                    "result": SubmissionResult.Name(patch_entry.result) if patch_entry.result else "NONE",
-                }
-                (patches_dir / f"patch_{patch_num:03d}_metadata.json").write_text(json.dumps(patch_metadata, indent=2))
-
-            # Write vulnerability metadata
+                patches_metadata.append(
+                    {
+                        "patch_file": patch_file.name,
+                        "internal_patch_id": patch_entry.internal_patch_id,
+                        "competition_patch_id": patch_entry.competition_patch_id,
+                        "result": result_name(patch_entry.result) if patch_entry.result else "NONE",
+                    }
+                )
+
+            # Write all metadata for the vulnerability in one go: one JSON file
+            # for the vulnerability itself and one NDJSON line per crash/patch
             vuln_metadata = {
                 "task_id": task_id,
                 "project_name": project_name,
@@ -334,7 +712,11 @@ def extract_povs(redis: Redis, command: ExtractPovsSettings) -> None:
                 "patch_idx": submission.patch_idx,
                 "stopped": submission.stop,
             }
-            (vuln_dir / "metadata.json").write_text(json.dumps(vuln_metadata, indent=2))
+            (vuln_dir / "metadata.json").write_bytes(dump_json(vuln_metadata))
+            if crashes_metadata:
+                (vuln_dir / "crashes.ndjson").write_bytes(b"".join(map(dump_json_line, crashes_metadata)))
+            if patches_metadata:
+                (vuln_dir / "patches.ndjson").write_bytes(b"".join(map(dump_json_line, patches_metadata)))
 
             logger.info(
                 f"Extracted vulnerability {vuln_num} for {project_name}/{task_id}: "
@@ -345,10 +727,31 @@ def extract_povs(redis: Redis, command: ExtractPovsSettings) -> None:
             logger.error(f"Failed to process submission {i}: {e}")
             continue
 
+    # Copy all PoV files as a single streamed tar archive instead of spawning one
+    # kubectl process per file. Anything missing from the stream (or the whole
+    # stream, e.g. when tar is unavailable in the pod) goes through a persistent
+    # kubectl exec session, and only files that session also fails on fall back
+    # to concurrent per-file kubectl cp calls.
+    if pov_copy_jobs:
+        logger.info(f"Copying {len(pov_copy_jobs)} PoV files in a single tar stream from pod '{pod_name}'")
+        missed_jobs = copy_povs_tar_stream(command.namespace, pod_name, pov_copy_jobs, stats)
+        if missed_jobs:
+            logger.info(f"Retrying {len(missed_jobs)} PoV files over a persistent kubectl exec session")
+            missed_jobs = copy_povs_exec_session(command.namespace, pod_name, missed_jobs, stats)
+        if missed_jobs:
+            logger.info(f"Retrying {len(missed_jobs)} PoV files with kubectl cp using {POV_COPY_MAX_WORKERS} workers")
+            with ThreadPoolExecutor(max_workers=POV_COPY_MAX_WORKERS) as executor:
+                futures = [executor.submit(copy_pov, remote, local) for remote, local in missed_jobs]
+                for future in futures:
+                    future.result()
+
     # Print summary
     total_vulns = sum(vuln_counter.values())
     logger.info(f"Extraction complete: {total_vulns} vulnerabilities across {len(vuln_counter)} tasks")
-    logger.info(f"PoV files: {stats['povs_copied']} copied, {stats['povs_failed']} failed")
+    logger.info(
+        f"PoV files: {stats['povs_copied']} copied, {stats['povs_skipped']} already present, "
+        f"{stats['povs_failed']} failed"
+    )
     for task_id, count in vuln_counter.items():
         logger.info(f"  {task_id}: {count} vulnerabilities")
 
@@ -417,63 +820,79 @@ def handle_subcommand(redis: Redis, command: BaseModel | None) -> None:
             print(build)
         logger.info("Done")
     elif isinstance(command, ReadSubmissionsSettings):
-        # Read submissions from Redis using the same key as the Submissions class
-        SUBMISSIONS_KEY = "submissions"
-        raw_submissions: list = redis.lrange(SUBMISSIONS_KEY, 0, -1)
         registry = TaskRegistry(redis)
 
-        if not raw_submissions:
+        n_submissions = redis.llen(SUBMISSIONS_KEY)
+        if not n_submissions:
             logger.info("No submissions found")
             return
 
-        logger.info(f"Found {len(raw_submissions)} submissions:")
+        logger.info(f"Found {n_submissions} submissions:")
         result: dict[TaskId, TaskResult] = {}
-        for i, raw in enumerate(raw_submissions):
+        task_cache: dict[str, Task | None] = {}
+        passed_result = SubmissionResult.PASSED  # avoid re-resolving the enum attribute per submission
+        for i, submission in iter_parsed_submissions(
+            redis,
+            SUBMISSIONS_KEY,
+            registry,
+            task_cache,
+            task_id=command.task_id,
+        ):
             try:
-                submission = SubmissionEntry.FromString(raw)
-                # Apply stacktrace truncation unless verbose mode is enabled
-                if not command.verbose:
-                    submission = truncate_stacktraces(submission)
-
+                # Apply the cheap filters first so filtered-out submissions don't pay
+                # for truncation or task lookups
                 if command.filter_stop:
                     if submission.stop:
                         logger.info(f"Skipping stopped submission {i}")
                         continue
 
                 task_id = submission.crashes[0].crash.crash.target.task_id
-                task = registry.get(task_id)
-                if task is None:
-                    logger.error(f"Task {task_id} not found in registry")
-                    continue
-
                 if command.task_id and task_id != command.task_id:
                     logger.info(f"Skipping submission {i} for task {task_id} (not {command.task_id})")
                     continue
 
+                task = task_cache.get(task_id)
+                if task is None:
+                    logger.error(f"Task {task_id} not found in registry")
+                    continue
+
                 if task_id not in result:
                     result[task_id] = TaskResult(
                         task_id=task_id,
                         project_name=task.project_name,
                         mode=str(task.task_type),
                     )
-                c = next((c for c in submission.crashes if c.result == SubmissionResult.PASSED), None)
-                if c:
+                passed_crash = None
+                for c in submission.crashes:
+                    if c.result == passed_result:
+                        passed_crash = c
+                        break
+                if passed_crash:
                     result[task_id].n_vulnerabilities += 1
 
-                p = next((p for p in submission.patches if p.result == SubmissionResult.PASSED), None)
-                if p:
+                passed_patch = next((p for p in submission.patches if p.result == passed_result), None)
+                if passed_patch:
                     result[task_id].n_patches += 1
-                    assert c is not None
-                    result[task_id].patched_vulnerabilities.append(c.competition_pov_id)
-                elif c:
-                    result[task_id].non_patched_vulnerabilities.append(c.competition_pov_id)
+                    assert passed_crash is not None
+                    result[task_id].patched_vulnerabilities.append(passed_crash.competition_pov_id)
+                elif passed_crash:
+                    result[task_id].non_patched_vulnerabilities.append(passed_crash.competition_pov_id)
 
-                b = next((b for b in submission.bundles), None)
-                if b:
+                # Only existence matters for bundles, so don't iterate the repeated field
+                if len(submission.bundles) > 0:
                     result[task_id].n_bundles += 1
 
                 print(f"--- Submission {i} ---")
-                print(submission)
+                # --verbose implies the full dump so existing invocations keep
+                # showing stacktraces; --verbose_dump alone truncates them
+                if command.verbose or command.verbose_dump:
+                    if not command.verbose:
+                        submission = truncate_stacktraces(submission)
+                    # Stream the text proto to stdout instead of materializing it
+                    # in memory via str(submission)
+                    PrintMessage(submission, sys.stdout, as_utf8=True)
+                else:
+                    sys.stdout.write(format_submission(submission))
                 print()
             except Exception as e:
                 logger.error(f"Failed to parse submission {i}: {e}")
@@ -124,6 +124,38 @@ def test_get_nonexistent_task(task_registry, redis_client):
     redis_client.hget.assert_called_with(task_registry.hash_name, "nonexistent")
 
 
+def test_get_many(task_registry, sample_task, redis_client):
+    # Setup: one existing (cancelled) task and one missing task
+    pipeline = redis_client.pipeline.return_value
+    pipeline.execute.return_value = [
+        sample_task.SerializeToString(),
+        True,
+        None,
+        False,
+    ]
+
+    # Test
+    result = task_registry.get_many(["TEST123", "nonexistent"])
+
+    # Verify one hget/sismember pair was queued per task id and executed once
+    pipeline.hget.assert_any_call(task_registry.hash_name, "test123")
+    pipeline.hget.assert_any_call(task_registry.hash_name, "nonexistent")
+    pipeline.sismember.assert_any_call(CANCELLED_TASKS_SET, "test123")
+    pipeline.execute.assert_called_once()
+
+    retrieved_task = result["TEST123"]
+    assert retrieved_task is not None
+    assert retrieved_task.task_id == sample_task.task_id
+    assert retrieved_task.cancelled is True
+    assert result["nonexistent"] is None
+
+
+def test_get_many_empty(task_registry, redis_client):
+    # No ids means no Redis round-trip at all
+    assert task_registry.get_many([]) == {}
+    redis_client.pipeline.assert_not_called()
+
+
 def test_delete_task(task_registry, sample_task, redis_client):
     # Setup
     redis_client.hexists.side_effect = lambda hash_name, key: key.lower() == "test123"
@@ -9,7 +9,7 @@ from pathlib import Path
 from buttercup.common import node_local
 from buttercup.common.challenge_task import ChallengeTask
 from buttercup.common.clusterfuzz_parser.crash_comparer import CrashComparer
-from buttercup.common.constants import ARCHITECTURE
+from buttercup.common.constants import ARCHITECTURE, SUBMISSIONS_KEY, submissions_by_task_key
 from buttercup.common.datastructures.msg_pb2 import (
     BuildOutput,
     BuildRequest,
@@ -689,8 +689,8 @@ class Submissions:
     Thread Safety: Designed for single-instance operation with Redis providing persistence.
     """
 
-    # Redis names
-    SUBMISSIONS = "submissions"
+    # Redis names (SUBMISSIONS is shared with the util CLI via common.constants)
+    SUBMISSIONS = SUBMISSIONS_KEY
     MATCHED_SARIFS = "matched_sarifs"
 
     redis: Redis
@@ -739,7 +739,12 @@ class Submissions:
     def _push(self, entry: SubmissionEntry) -> int:
         """Push a submission to Redis."""
         result = self.redis.rpush(self.SUBMISSIONS, entry.SerializeToString())
-        return int(result)
+        length = int(result)
+        # Maintain a per-task secondary index so tools (e.g. the util CLI) can fetch a
+        # single task's submissions without scanning the whole list. Entries are never
+        # removed from the list, so the stored offsets remain stable.
+        self.redis.sadd(submissions_by_task_key(_task_id(entry)), length - 1)
+        return length
 
     def _enumerate_submissions(self) -> Iterator[tuple[int, SubmissionEntry]]:
         """Enumerate all submissions belonging to active tasks."""
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from buttercup.common.clusterfuzz_parser.crash_comparer import CrashComparer
-from buttercup.common.constants import ARCHITECTURE
+from buttercup.common.constants import ARCHITECTURE, submissions_by_task_key
 from buttercup.common.datastructures.msg_pb2 import (
     BuildOutput,
     BuildType,
@@ -607,6 +607,17 @@ class TestSubmissions:
         # POV ID should not be set yet
         assert not entry.crashes[0].competition_pov_id
 
+    def test_submit_vulnerability_records_task_index(self, submissions, sample_crash, mock_redis):
+        # The new entry lands at the end of the submissions list; its offset must be
+        # recorded in the per-task index so the util CLI can fetch a single task's
+        # submissions without scanning the whole list
+        mock_redis.rpush.return_value = 1  # List length after the push
+
+        assert submissions.submit_vulnerability(sample_crash) is True
+
+        task_id = sample_crash.crash.target.task_id
+        mock_redis.sadd.assert_called_once_with(submissions_by_task_key(task_id), 0)
+
     def test_submit_vulnerability_failed(self, submissions, mock_competition_api, sample_crash):
         # Configure mock Redis to return proper values
         submissions.redis.rpush.return_value = 1  # Index of the inserted entry
@@ -3,13 +3,15 @@
 import logging
 import re
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
 from buttercup.common.challenge_task import ChallengeTask
 from buttercup.common.project_yaml import Language, ProjectYaml
-from tree_sitter_language_pack import get_language, get_parser
+from tree_sitter import Language as TSLanguage
+from tree_sitter import Node, Query, Tree
+from tree_sitter_language_pack import SupportedLanguage, get_language, get_parser
 
 from buttercup.program_model.utils.common import (
     Function,
@@ -478,6 +480,49 @@ QUERY_STR_CLASS_MEMBERS_JAVA = """;; Match field declarations without explicit m
 )"""
 
 
+# All capture patterns for a language fused into one query. tree-sitter amortizes
+# the node traversal across every pattern within a single query, so running the
+# combined form costs one tree walk instead of one per pattern.
+QUERY_STR_COMBINED_CSHARP = "\n".join((QUERY_STR_CSHARP, QUERY_STR_TYPES_CSHARP, QUERY_STR_CLASS_MEMBERS_CSHARP))
+QUERY_STR_COMBINED_JAVASCRIPT = "\n".join(
+    (QUERY_STR_JAVASCRIPT, QUERY_STR_TYPES_JAVASCRIPT, QUERY_STR_CLASS_MEMBERS_JAVASCRIPT)
+)
+
+_COMBINED_QUERY_STRS: dict[str, str] = {
+    "csharp": QUERY_STR_COMBINED_CSHARP,
+    "typescript": QUERY_STR_COMBINED_JAVASCRIPT,
+}
+
+
+def run_combined_query(tree: Tree, lang_name: SupportedLanguage) -> dict[str, list[Node]]:
+    """Run every capture pattern for a language over a tree in a single traversal.
+
+    Returns the captured nodes keyed by capture name (e.g. "function.name",
+    "type.name", "method_name").
+    """
+    query_str = _COMBINED_QUERY_STRS.get(lang_name)
+    if query_str is None:
+        raise ValueError(f"No combined query for language: {lang_name}")
+    return get_cached_query(lang_name, query_str).captures(tree.root_node)
+
+
+@cache
+def get_cached_language(lang_name: SupportedLanguage) -> TSLanguage:
+    """Return the tree-sitter Language for a language name, constructing it at most once."""
+    return get_language(lang_name)
+
+
+@cache
+def get_cached_query(lang_name: SupportedLanguage, query_str: str) -> Query:
+    """Return the compiled Query for (language, query string), compiling it at most once.
+
+    Query compilation is pure CPU-bound pattern construction with no dependency on the
+    tree being queried, so callers reusing the module-level query strings can share a
+    single compiled object.
+    """
+    return get_cached_language(lang_name).query(query_str)
+
+
 @dataclass
 class CodeTS:
     """Class to extract information about functions in a challenge project using TreeSitter."""
@@ -487,46 +532,45 @@ class CodeTS:
     def __post_init__(self) -> None:
         """Initialize the CodeTS object."""
         self.project_yaml = ProjectYaml(self.challenge_task, self.challenge_task.task_meta.project_name)
+        lang_name: SupportedLanguage
         if self.project_yaml.unified_language == Language.C:
-            self.parser = get_parser("c")
-            self.language = get_language("c")
+            lang_name = "c"
             query_str = QUERY_STR_C
             types_query_str = QUERY_STR_TYPES_C
             query_class_members = None
         elif self.project_yaml.unified_language == Language.CPP:
-            self.parser = get_parser("cpp")
-            self.language = get_language("cpp")
+            lang_name = "cpp"
             query_str = QUERY_STR_CPP
             types_query_str = QUERY_STR_TYPES_CPP
             query_class_members = None
         elif self.project_yaml.unified_language == Language.JAVA:
-            self.parser = get_parser("java")
-            self.language = get_language("java")
+            lang_name = "java"
             query_str = QUERY_STR_JAVA
             types_query_str = QUERY_STR_TYPES_JAVA
             query_class_members = QUERY_STR_CLASS_MEMBERS_JAVA
         elif self.project_yaml.unified_language == Language.CSHARP:
-            self.parser = get_parser("csharp")
-            self.language = get_language("csharp")
+            lang_name = "csharp"
             query_str = QUERY_STR_CSHARP
             types_query_str = QUERY_STR_TYPES_CSHARP
             query_class_members = QUERY_STR_CLASS_MEMBERS_CSHARP
         elif self.project_yaml.unified_language == Language.JAVASCRIPT:
-            self.parser = get_parser("typescript")
-            self.language = get_language("typescript")
+            lang_name = "typescript"
             query_str = QUERY_STR_JAVASCRIPT
             types_query_str = QUERY_STR_TYPES_JAVASCRIPT
             query_class_members = QUERY_STR_CLASS_MEMBERS_JAVASCRIPT
         else:
             raise ValueError(f"Unsupported language: {self.project_yaml.language}")
 
+        self.parser = get_parser(lang_name)
+        self.language = get_cached_language(lang_name)
+
         self.get_functions_in_code = lru_cache(maxsize=1000)(self.get_functions_in_code)  # type: ignore [method-assign]
         self.get_function = lru_cache(maxsize=1000)(self.get_function)  # type: ignore [method-assign]
 
         try:
-            self.query = self.language.query(query_str)
-            self.query_types = self.language.query(types_query_str)
-            self.query_class_members = self.language.query(query_class_members) if query_class_members else None
+            self.query = get_cached_query(lang_name, query_str)
+            self.query_types = get_cached_query(lang_name, types_query_str)
+            self.query_class_members = get_cached_query(lang_name, query_class_members) if query_class_members else None
         except Exception:
             raise ValueError("Query string is invalid")
 
@@ -0,0 +1,9 @@
+import { someLibrary } from 'some-library';
+
+function processData(data) {
+    return someLibrary.process(Buffer.from(data).toString());
+}
+
+export async function fuzz(data) {
+    processData(data);
+}
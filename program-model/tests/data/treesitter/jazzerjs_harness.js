@@ -0,0 +1,17 @@
+const { fuzz } = require('@jazzer.js/core');
+
+function processInput(data) {
+    if (data.length > 4) {
+        const str = Buffer.from(data).toString('utf-8');
+        parse(str);
+    }
+}
+
+function parse(input) {
+    // parsing logic
+    JSON.parse(input);
+}
+
+module.exports.fuzz = function(data) {
+    processInput(data);
+};
@@ -0,0 +1,60 @@
+using System;
+using System.Collections.Generic;
+using static System.Math;
+
+namespace MyApp.Models
+{
+    public interface IRepository<T>
+    {
+        T GetById(int id);
+        void Save(T entity);
+        List<T> GetAll();
+    }
+
+    public class UserService
+    {
+        private readonly string _connectionString;
+        private int _retryCount;
+
+        public UserService(string connectionString)
+        {
+            _connectionString = connectionString;
+            _retryCount = 3;
+        }
+
+        public async Task<User> GetUserAsync(int userId)
+        {
+            return await _repository.GetByIdAsync(userId);
+        }
+
+        public void DeleteUser(int userId)
+        {
+            _repository.Delete(userId);
+        }
+
+        private static bool ValidateEmail(string email)
+        {
+            return email.Contains("@");
+        }
+    }
+
+    public struct Point
+    {
+        public double X;
+        public double Y;
+
+        public double Distance()
+        {
+            return Sqrt(X * X + Y * Y);
+        }
+    }
+
+    public enum Status
+    {
+        Active,
+        Inactive,
+        Pending
+    }
+
+    public record PersonRecord(string Name, int Age);
+}
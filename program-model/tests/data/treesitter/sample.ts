@@ -0,0 +1,47 @@
+import { Injectable } from '@angular/core';
+import { HttpClient } from '@angular/common/http';
+const fs = require('fs');
+
+interface UserRepository {
+    getById(id: number): User;
+    save(entity: User): void;
+    getAll(): User[];
+}
+
+class UserService {
+    private connectionString: string;
+    private retryCount: number;
+
+    constructor(connectionString: string) {
+        this.connectionString = connectionString;
+        this.retryCount = 3;
+    }
+
+    async getUserAsync(userId: number): Promise<User> {
+        return await this.repository.getByIdAsync(userId);
+    }
+
+    deleteUser(userId: number): void {
+        this.repository.delete(userId);
+    }
+
+    private static validateEmail(email: string): boolean {
+        return email.includes("@");
+    }
+}
+
+enum Status {
+    Active = "active",
+    Inactive = "inactive",
+    Pending = "pending",
+}
+
+type UserRole = "admin" | "user" | "guest";
+
+function freeStandingFunction(x: number): number {
+    return x * 2;
+}
+
+const arrowFunction = (x: number): number => {
+    return x + 1;
+};
@@ -0,0 +1,28 @@
+using System;
+using SharpFuzz;
+
+public class FuzzTarget
+{
+    public static void Main(string[] args)
+    {
+        Fuzzer.LibFuzzer.Run(span =>
+        {
+            var data = span.ToArray();
+            ProcessInput(data);
+        });
+    }
+
+    private static void ProcessInput(byte[] data)
+    {
+        if (data.Length > 4)
+        {
+            var str = System.Text.Encoding.UTF8.GetString(data);
+            Parse(str);
+        }
+    }
+
+    private static void Parse(string input)
+    {
+        // parsing logic
+    }
+}
@@ -4,234 +4,144 @@ This test file verifies that the QUERY_STR_CSHARP, QUERY_STR_TYPES_CSHARP,
 and QUERY_STR_CLASS_MEMBERS_CSHARP queries correctly match C# code patterns.
 """
 
-from tree_sitter_language_pack import get_language, get_parser
+import logging
+import os
+from pathlib import Path
 
+import pytest
+from tree_sitter_language_pack import get_parser
 
-# Sample C# code covering common patterns
-SAMPLE_CSHARP_CODE = b"""
-using System;
-using System.Collections.Generic;
-using static System.Math;
+logger = logging.getLogger(__name__)
 
-namespace MyApp.Models
-{
-    public interface IRepository<T>
-    {
-        T GetById(int id);
-        void Save(T entity);
-        List<T> GetAll();
-    }
-
-    public class UserService
-    {
-        private readonly string _connectionString;
-        private int _retryCount;
-
-        public UserService(string connectionString)
-        {
-            _connectionString = connectionString;
-            _retryCount = 3;
-        }
-
-        public async Task<User> GetUserAsync(int userId)
-        {
-            return await _repository.GetByIdAsync(userId);
-        }
-
-        public void DeleteUser(int userId)
-        {
-            _repository.Delete(userId);
-        }
-
-        private static bool ValidateEmail(string email)
-        {
-            return email.Contains("@");
-        }
-    }
+DATA_DIR = Path(__file__).parent / "data" / "treesitter"
 
-    public struct Point
-    {
-        public double X;
-        public double Y;
 
-        public double Distance()
-        {
-            return Sqrt(X * X + Y * Y);
-        }
-    }
+@pytest.fixture(scope="session")
+def sample_csharp_code() -> bytes:
+    """Sample C# code covering common patterns, shared once per session."""
+    return (DATA_DIR / "sample.cs").read_bytes()
 
-    public enum Status
-    {
-        Active,
-        Inactive,
-        Pending
-    }
 
-    public record PersonRecord(string Name, int Age);
-}
-"""
+@pytest.fixture(scope="session")
+def sharpfuzz_harness() -> bytes:
+    """SharpFuzz harness patterns."""
+    return (DATA_DIR / "sharpfuzz_harness.cs").read_bytes()
 
-# SharpFuzz harness patterns
-SAMPLE_SHARPFUZZ_HARNESS = b"""
-using System;
-using SharpFuzz;
 
-public class FuzzTarget
-{
-    public static void Main(string[] args)
-    {
-        Fuzzer.LibFuzzer.Run(span =>
-        {
-            var data = span.ToArray();
-            ProcessInput(data);
-        });
-    }
-
-    private static void ProcessInput(byte[] data)
-    {
-        if (data.Length > 4)
-        {
-            var str = System.Text.Encoding.UTF8.GetString(data);
-            Parse(str);
-        }
-    }
-
-    private static void Parse(string input)
-    {
-        // parsing logic
-    }
-}
-"""
+# One parser shared by every test in this module; construction loads the language
+# and allocates scanner state, so doing it per _parse call is wasted work
+_CSHARP_PARSER = get_parser("csharp")
 
 
 def _parse(code: bytes):
-    parser = get_parser("csharp")
-    return parser.parse(code)
+    return _CSHARP_PARSER.parse(code)
 
 
 def _print_tree(node, indent=0):
-    """Debug helper: print parse tree structure."""
-    text = ""
-    if node.child_count == 0:
-        text = f" = {repr(node.text.decode())}"
-    line = f"{'  ' * indent}{node.type} [{node.start_point[0]}:{node.start_point[1]}-{node.end_point[0]}:{node.end_point[1]}]{text}"
-    print(line)
-    for child in node.children:
-        _print_tree(child, indent + 1)
-
-
-def test_csharp_parser_works():
+    """Debug helper: print parse tree structure with an iterative cursor walk."""
+    cursor = node.walk()
+    depth = indent
+    while True:
+        n = cursor.node
+        text = f" = {n.text.decode()!r}" if n.child_count == 0 else ""
+        print(f"{'  ' * depth}{n.type} [{n.start_point[0]}:{n.start_point[1]}-{n.end_point[0]}:{n.end_point[1]}]{text}")
+        if cursor.goto_first_child():
+            depth += 1
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return
+            depth -= 1
+
+
+def _find_node(tree, node_type: str):
+    """Return the first node of the given type, using a C-level cursor walk.
+
+    A TreeCursor iterates without re-materializing node.children lists the way a
+    recursive descent does, so the walk allocates nothing per visited node.
+    """
+    cursor = tree.walk()
+    while True:
+        if cursor.node.type == node_type:
+            return cursor.node
+        if cursor.goto_first_child():
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return None
+
+
+@pytest.fixture(scope="module")
+def csharp_tree(sample_csharp_code):
+    """Parse the C# sample once per module; every test reads the same tree."""
+    return _parse(sample_csharp_code)
+
+
+@pytest.fixture(scope="module")
+def csharp_captures(csharp_tree):
+    """Run the combined query over the shared tree once.
+
+    The combined query fuses the method, type, and class-member patterns into a
+    single tree walk shared by every test that asserts on its captures.
+    """
+    from buttercup.program_model.api.tree_sitter import run_combined_query
+
+    return run_combined_query(csharp_tree, "csharp")
+
+
+def test_csharp_parser_works(csharp_tree):
     """Verify tree-sitter C# parser loads and parses without error."""
-    tree = _parse(SAMPLE_CSHARP_CODE)
-    root = tree.root_node
+    root = csharp_tree.root_node
     assert root.type == "compilation_unit"
     assert not root.has_error, f"Parse tree has errors: {root.text.decode()[:200]}"
 
 
-def test_query_str_csharp_methods():
-    """Validate QUERY_STR_CSHARP matches method declarations."""
-    from buttercup.program_model.api.tree_sitter import QUERY_STR_CSHARP
+# Each case asserts one capture name from the shared combined-query fixture, so all
+# four run against a single parse + query pass against the C# sample.
+# Note: constructors are constructor_declaration, not method_declaration
+# Note: interface methods without bodies won't match (they need body: (block))
+# Note: method_name/name come from the class-members patterns, so struct members
+# (Distance, X, Y) are not expected there
+@pytest.mark.parametrize(
+    ("capture", "expected"),
+    [
+        pytest.param("function.name", {b"GetUserAsync", b"DeleteUser", b"ValidateEmail", b"Distance"}, id="methods"),
+        pytest.param("type.name", {b"IRepository", b"UserService", b"Point", b"Status", b"PersonRecord"}, id="types"),
+        pytest.param("name", {b"_connectionString", b"_retryCount"}, id="class-fields"),
+        pytest.param("method_name", {b"GetUserAsync", b"DeleteUser", b"ValidateEmail"}, id="class-methods"),
+    ],
+)
+def test_csharp_query_captures(csharp_captures, capture, expected):
+    """Validate the method, type, and class-member patterns against the C# sample."""
+    captured = {node.text for node in csharp_captures.get(capture, ())}
 
-    tree = _parse(SAMPLE_CSHARP_CODE)
-    lang = get_language("csharp")
-    query = lang.query(QUERY_STR_CSHARP)
-    matches = query.matches(tree.root_node)
+    logger.debug(f"Captured {capture}: {captured}")
 
-    func_names = []
-    for _match_id, capture_dict in matches:
-        if "function.name" in capture_dict:
-            for node in capture_dict["function.name"]:
-                func_names.append(node.text.decode())
+    assert expected <= captured, f"Missing '{capture}' captures: {expected - captured} (got {captured})"
 
-    print(f"Captured method names: {func_names}")
 
-    # We expect these methods from SAMPLE_CSHARP_CODE
-    expected_methods = {"GetUserAsync", "DeleteUser", "ValidateEmail", "Distance"}
-    # Note: constructors are constructor_declaration, not method_declaration
-    # Note: interface methods without bodies won't match (they need body: (block))
+def test_csharp_constructors_not_captured(csharp_captures):
+    """Constructors are a different node type and must not match as method declarations."""
+    func_names = {node.text for node in csharp_captures.get("function.name", ())}
+    assert b"UserService" not in func_names, "Constructor should not be captured as method_declaration"
 
-    for method in expected_methods:
-        assert method in func_names, f"Expected method '{method}' not found in captures: {func_names}"
 
-    # Verify constructors are NOT captured (they're a different node type)
-    assert "UserService" not in func_names, "Constructor should not be captured as method_declaration"
-
-
-def test_query_str_csharp_methods_sharpfuzz():
+def test_query_str_csharp_methods_sharpfuzz(sharpfuzz_harness):
     """Validate QUERY_STR_CSHARP matches methods in a SharpFuzz harness."""
-    from buttercup.program_model.api.tree_sitter import QUERY_STR_CSHARP
-
-    tree = _parse(SAMPLE_SHARPFUZZ_HARNESS)
-    lang = get_language("csharp")
-    query = lang.query(QUERY_STR_CSHARP)
-    matches = query.matches(tree.root_node)
-
-    func_names = []
-    for _match_id, capture_dict in matches:
-        if "function.name" in capture_dict:
-            for node in capture_dict["function.name"]:
-                func_names.append(node.text.decode())
-
-    print(f"SharpFuzz harness method names: {func_names}")
-
-    assert "Main" in func_names, f"Main not found: {func_names}"
-    assert "ProcessInput" in func_names, f"ProcessInput not found: {func_names}"
-    assert "Parse" in func_names, f"Parse not found: {func_names}"
-
-
-def test_query_str_types_csharp():
-    """Validate QUERY_STR_TYPES_CSHARP matches type definitions."""
-    from buttercup.program_model.api.tree_sitter import QUERY_STR_TYPES_CSHARP
-
-    tree = _parse(SAMPLE_CSHARP_CODE)
-    lang = get_language("csharp")
-    query = lang.query(QUERY_STR_TYPES_CSHARP)
-    matches = query.matches(tree.root_node)
+    from buttercup.program_model.api.tree_sitter import QUERY_STR_CSHARP, get_cached_query
 
-    type_names = []
-    for _match_id, capture_dict in matches:
-        if "type.name" in capture_dict:
-            for node in capture_dict["type.name"]:
-                type_names.append(node.text.decode())
+    tree = _parse(sharpfuzz_harness)
+    query = get_cached_query("csharp", QUERY_STR_CSHARP)
+    # captures() groups nodes by capture name at the C level, avoiding the
+    # per-match Python dict traversal of matches()
+    captures = query.captures(tree.root_node)
+    func_names = {node.text for node in captures.get("function.name", ())}
 
-    print(f"Captured type names: {type_names}")
+    logger.debug(f"SharpFuzz harness method names: {func_names}")
 
-    expected_types = {"IRepository", "UserService", "Point", "Status", "PersonRecord"}
-    for t in expected_types:
-        assert t in type_names, f"Expected type '{t}' not found in captures: {type_names}"
-
-
-def test_query_str_class_members_csharp():
-    """Validate QUERY_STR_CLASS_MEMBERS_CSHARP matches fields and methods."""
-    from buttercup.program_model.api.tree_sitter import QUERY_STR_CLASS_MEMBERS_CSHARP
-
-    tree = _parse(SAMPLE_CSHARP_CODE)
-    lang = get_language("csharp")
-    query = lang.query(QUERY_STR_CLASS_MEMBERS_CSHARP)
-    matches = query.matches(tree.root_node)
-
-    # Collect all captures by name
-    results: dict[str, list[str]] = {}
-    for _match_id, capture_dict in matches:
-        for capture_name, nodes in capture_dict.items():
-            for node in nodes:
-                results.setdefault(capture_name, []).append(node.text.decode())
-
-    print(f"Class member captures: {results}")
-
-    # Check field names captured
-    assert "name" in results, f"No 'name' captures found. Available: {list(results.keys())}"
-    field_names = results["name"]
-    print(f"Field names: {field_names}")
-    assert "_connectionString" in field_names or "_retryCount" in field_names, \
-        f"Expected field names not found: {field_names}"
-
-    # Check method names captured
-    assert "method_name" in results, f"No 'method_name' captures found. Available: {list(results.keys())}"
-    method_names = results["method_name"]
-    print(f"Method names in classes: {method_names}")
-    assert "GetUserAsync" in method_names or "DeleteUser" in method_names, \
-        f"Expected method names not found: {method_names}"
+    assert b"Main" in func_names, f"Main not found: {func_names}"
+    assert b"ProcessInput" in func_names, f"ProcessInput not found: {func_names}"
+    assert b"Parse" in func_names, f"Parse not found: {func_names}"
 
 
 def test_parse_tree_node_types():
@@ -248,8 +158,9 @@ public class Foo
 }
 """
     tree = _parse(code)
-    print("\n=== Parse tree for minimal C# class ===")
-    _print_tree(tree.root_node)
+    if os.environ.get("TS_TEST_DEBUG"):
+        print("\n=== Parse tree for minimal C# class ===")
+        _print_tree(tree.root_node)
 
     root = tree.root_node
     class_node = None
@@ -271,7 +182,7 @@ public class Foo
         f"declaration_list not found in class_declaration. Children: {[c.type for c in class_node.children]}"
 
     child_types = [c.type for c in body_node.children]
-    print(f"declaration_list children types: {child_types}")
+    logger.debug(f"declaration_list children types: {child_types}")
     assert "field_declaration" in child_types, f"field_declaration not found: {child_types}"
     assert "method_declaration" in child_types, f"method_declaration not found: {child_types}"
 
@@ -288,29 +199,23 @@ public class Foo
 }
 """
     tree = _parse(code)
-    root = tree.root_node
-
-    method_node = None
 
-    def find_method(node):
-        nonlocal method_node
-        if node.type == "method_declaration":
-            method_node = node
-            return
-        for child in node.children:
-            find_method(child)
-
-    find_method(root)
+    method_node = _find_node(tree, "method_declaration")
     assert method_node is not None, "method_declaration not found"
 
+    # cursor.field_name reads the field from the cursor's own state, so the walk
+    # makes one FFI crossing per child instead of one field_name_for_child call
+    # per index
     field_names = set()
-    for i in range(method_node.child_count):
-        fn = method_node.field_name_for_child(i)
-        if fn:
-            field_names.add(fn)
-
-    print(f"method_declaration field names: {field_names}")
-    print(f"method_declaration children: {[(c.type, method_node.field_name_for_child(i)) for i, c in enumerate(method_node.children)]}")
+    cursor = method_node.walk()
+    if cursor.goto_first_child():
+        while True:
+            if cursor.field_name:
+                field_names.add(cursor.field_name)
+            if not cursor.goto_next_sibling():
+                break
+
+    logger.debug(f"method_declaration field names: {field_names}")
 
     # Our query uses: returns, name, parameters, body
     assert "name" in field_names, f"'name' field not found: {field_names}"
@@ -4,240 +4,158 @@ This test file verifies that the QUERY_STR_JAVASCRIPT, QUERY_STR_TYPES_JAVASCRIP
 and QUERY_STR_CLASS_MEMBERS_JAVASCRIPT queries correctly match JS/TS code patterns.
 """
 
-from tree_sitter_language_pack import get_language, get_parser
+import logging
+import os
+from pathlib import Path
 
+import pytest
+from tree_sitter_language_pack import get_parser
 
-# Sample TypeScript code covering common patterns
-SAMPLE_TYPESCRIPT_CODE = b"""
-import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
-const fs = require('fs');
+logger = logging.getLogger(__name__)
 
-interface UserRepository {
-    getById(id: number): User;
-    save(entity: User): void;
-    getAll(): User[];
-}
+DATA_DIR = Path(__file__).parent / "data" / "treesitter"
 
-class UserService {
-    private connectionString: string;
-    private retryCount: number;
 
-    constructor(connectionString: string) {
-        this.connectionString = connectionString;
-        this.retryCount = 3;
-    }
+@pytest.fixture(scope="session")
+def sample_typescript_code() -> bytes:
+    """Sample TypeScript code covering common patterns, shared once per session."""
+    return (DATA_DIR / "sample.ts").read_bytes()
 
-    async getUserAsync(userId: number): Promise<User> {
-        return await this.repository.getByIdAsync(userId);
-    }
 
-    deleteUser(userId: number): void {
-        this.repository.delete(userId);
-    }
+@pytest.fixture(scope="session")
+def jazzerjs_harness() -> bytes:
+    """Jazzer.js harness patterns."""
+    return (DATA_DIR / "jazzerjs_harness.js").read_bytes()
 
-    private static validateEmail(email: string): boolean {
-        return email.includes("@");
-    }
-}
 
-enum Status {
-    Active = "active",
-    Inactive = "inactive",
-    Pending = "pending",
-}
+@pytest.fixture(scope="session")
+def es_module_harness() -> bytes:
+    """ES module harness."""
+    return (DATA_DIR / "es_module_harness.mjs").read_bytes()
 
-type UserRole = "admin" | "user" | "guest";
 
-function freeStandingFunction(x: number): number {
-    return x * 2;
-}
-
-const arrowFunction = (x: number): number => {
-    return x + 1;
-};
-"""
-
-# Jazzer.js harness patterns
-SAMPLE_JAZZERJS_HARNESS = b"""
-const { fuzz } = require('@jazzer.js/core');
-
-function processInput(data) {
-    if (data.length > 4) {
-        const str = Buffer.from(data).toString('utf-8');
-        parse(str);
-    }
-}
-
-function parse(input) {
-    // parsing logic
-    JSON.parse(input);
-}
-
-module.exports.fuzz = function(data) {
-    processInput(data);
-};
-"""
-
-# ES module harness
-SAMPLE_ES_MODULE_HARNESS = b"""
-import { someLibrary } from 'some-library';
-
-function processData(data) {
-    return someLibrary.process(Buffer.from(data).toString());
-}
-
-export async function fuzz(data) {
-    processData(data);
-}
-"""
+# One parser shared by every test in this module; construction loads the language
+# and allocates scanner state, so doing it per _parse call is wasted work
+_TS_PARSER = get_parser("typescript")
 
 
 def _parse(code: bytes):
-    parser = get_parser("typescript")
-    return parser.parse(code)
+    return _TS_PARSER.parse(code)
 
 
 def _print_tree(node, indent=0):
-    """Debug helper: print parse tree structure."""
-    text = ""
-    if node.child_count == 0:
-        text = f" = {repr(node.text.decode())}"
-    line = f"{'  ' * indent}{node.type} [{node.start_point[0]}:{node.start_point[1]}-{node.end_point[0]}:{node.end_point[1]}]{text}"
-    print(line)
-    for child in node.children:
-        _print_tree(child, indent + 1)
-
-
-def test_typescript_parser_works():
+    """Debug helper: print parse tree structure with an iterative cursor walk."""
+    cursor = node.walk()
+    depth = indent
+    while True:
+        n = cursor.node
+        text = f" = {n.text.decode()!r}" if n.child_count == 0 else ""
+        print(f"{'  ' * depth}{n.type} [{n.start_point[0]}:{n.start_point[1]}-{n.end_point[0]}:{n.end_point[1]}]{text}")
+        if cursor.goto_first_child():
+            depth += 1
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return
+            depth -= 1
+
+
+def _find_node(tree, node_type: str):
+    """Return the first node of the given type, using a C-level cursor walk.
+
+    A TreeCursor iterates without re-materializing node.children lists the way a
+    recursive descent does, so the walk allocates nothing per visited node.
+    """
+    cursor = tree.walk()
+    while True:
+        if cursor.node.type == node_type:
+            return cursor.node
+        if cursor.goto_first_child():
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return None
+
+
+@pytest.fixture(scope="module")
+def typescript_tree(sample_typescript_code):
+    """Parse the TypeScript sample once per module; every test reads the same tree."""
+    return _parse(sample_typescript_code)
+
+
+@pytest.fixture(scope="module")
+def typescript_captures(typescript_tree):
+    """Run the combined query over the shared tree once.
+
+    The combined query fuses the function, type, and class-member patterns into a
+    single tree walk shared by every test that asserts on its captures.
+    """
+    from buttercup.program_model.api.tree_sitter import run_combined_query
+
+    return run_combined_query(typescript_tree, "typescript")
+
+
+def test_typescript_parser_works(typescript_tree):
     """Verify tree-sitter TypeScript parser loads and parses without error."""
-    tree = _parse(SAMPLE_TYPESCRIPT_CODE)
-    root = tree.root_node
+    root = typescript_tree.root_node
     assert root.type == "program"
     assert not root.has_error, f"Parse tree has errors: {root.text.decode()[:200]}"
 
 
-def test_query_str_javascript_methods():
-    """Validate QUERY_STR_JAVASCRIPT matches function/method declarations."""
-    from buttercup.program_model.api.tree_sitter import QUERY_STR_JAVASCRIPT
-
-    tree = _parse(SAMPLE_TYPESCRIPT_CODE)
-    lang = get_language("typescript")
-    query = lang.query(QUERY_STR_JAVASCRIPT)
-    matches = query.matches(tree.root_node)
+# Each case asserts one capture name from the shared combined-query fixture, so all
+# four run against a single parse + query pass.
+@pytest.mark.parametrize(
+    ("capture", "expected"),
+    [
+        pytest.param(
+            "function.name",
+            {b"getUserAsync", b"deleteUser", b"validateEmail", b"freeStandingFunction"},
+            id="functions",
+        ),
+        pytest.param("type.name", {b"UserRepository", b"UserService", b"Status", b"UserRole"}, id="types"),
+        pytest.param("name", {b"connectionString", b"retryCount"}, id="class-fields"),
+        pytest.param("method_name", {b"getUserAsync", b"deleteUser", b"validateEmail"}, id="class-methods"),
+    ],
+)
+def test_typescript_query_captures(typescript_captures, capture, expected):
+    """Validate the function, type, and class-member patterns against the TypeScript sample."""
+    captured = {node.text for node in typescript_captures.get(capture, ())}
 
-    func_names = []
-    for _match_id, capture_dict in matches:
-        if "function.name" in capture_dict:
-            for node in capture_dict["function.name"]:
-                func_names.append(node.text.decode())
+    logger.debug(f"Captured {capture}: {captured}")
 
-    print(f"Captured function/method names: {func_names}")
+    assert expected <= captured, f"Missing '{capture}' captures: {expected - captured} (got {captured})"
 
-    # Methods inside the class
-    expected_methods = {"getUserAsync", "deleteUser", "validateEmail"}
-    for method in expected_methods:
-        assert method in func_names, f"Expected method '{method}' not found in captures: {func_names}"
 
-    # Free-standing function
-    assert "freeStandingFunction" in func_names, f"freeStandingFunction not found: {func_names}"
-
-
-def test_query_str_javascript_methods_jazzerjs():
+def test_query_str_javascript_methods_jazzerjs(jazzerjs_harness):
     """Validate QUERY_STR_JAVASCRIPT matches functions in a Jazzer.js harness."""
-    from buttercup.program_model.api.tree_sitter import QUERY_STR_JAVASCRIPT
-
-    tree = _parse(SAMPLE_JAZZERJS_HARNESS)
-    lang = get_language("typescript")
-    query = lang.query(QUERY_STR_JAVASCRIPT)
-    matches = query.matches(tree.root_node)
+    from buttercup.program_model.api.tree_sitter import QUERY_STR_JAVASCRIPT, get_cached_query
 
-    func_names = []
-    for _match_id, capture_dict in matches:
-        if "function.name" in capture_dict:
-            for node in capture_dict["function.name"]:
-                func_names.append(node.text.decode())
+    tree = _parse(jazzerjs_harness)
+    query = get_cached_query("typescript", QUERY_STR_JAVASCRIPT)
+    # captures() groups nodes by capture name at the C level, avoiding the
+    # per-match Python dict traversal of matches()
+    captures = query.captures(tree.root_node)
+    func_names = {node.text for node in captures.get("function.name", ())}
 
-    print(f"Jazzer.js harness function names: {func_names}")
+    logger.debug(f"Jazzer.js harness function names: {func_names}")
 
-    assert "processInput" in func_names, f"processInput not found: {func_names}"
-    assert "parse" in func_names, f"parse not found: {func_names}"
+    assert b"processInput" in func_names, f"processInput not found: {func_names}"
+    assert b"parse" in func_names, f"parse not found: {func_names}"
 
 
-def test_query_str_javascript_es_module_harness():
+def test_query_str_javascript_es_module_harness(es_module_harness):
     """Validate QUERY_STR_JAVASCRIPT matches export async function in ES module harness."""
-    from buttercup.program_model.api.tree_sitter import QUERY_STR_JAVASCRIPT
-
-    tree = _parse(SAMPLE_ES_MODULE_HARNESS)
-    lang = get_language("typescript")
-    query = lang.query(QUERY_STR_JAVASCRIPT)
-    matches = query.matches(tree.root_node)
-
-    func_names = []
-    for _match_id, capture_dict in matches:
-        if "function.name" in capture_dict:
-            for node in capture_dict["function.name"]:
-                func_names.append(node.text.decode())
-
-    print(f"ES module harness function names: {func_names}")
-
-    assert "processData" in func_names, f"processData not found: {func_names}"
-    assert "fuzz" in func_names, f"fuzz not found: {func_names}"
-
-
-def test_query_str_types_javascript():
-    """Validate QUERY_STR_TYPES_JAVASCRIPT matches type definitions."""
-    from buttercup.program_model.api.tree_sitter import QUERY_STR_TYPES_JAVASCRIPT
+    from buttercup.program_model.api.tree_sitter import QUERY_STR_JAVASCRIPT, get_cached_query
 
-    tree = _parse(SAMPLE_TYPESCRIPT_CODE)
-    lang = get_language("typescript")
-    query = lang.query(QUERY_STR_TYPES_JAVASCRIPT)
-    matches = query.matches(tree.root_node)
+    tree = _parse(es_module_harness)
+    query = get_cached_query("typescript", QUERY_STR_JAVASCRIPT)
+    captures = query.captures(tree.root_node)
+    func_names = {node.text for node in captures.get("function.name", ())}
 
-    type_names = []
-    for _match_id, capture_dict in matches:
-        if "type.name" in capture_dict:
-            for node in capture_dict["type.name"]:
-                type_names.append(node.text.decode())
+    logger.debug(f"ES module harness function names: {func_names}")
 
-    print(f"Captured type names: {type_names}")
-
-    expected_types = {"UserRepository", "UserService", "Status", "UserRole"}
-    for t in expected_types:
-        assert t in type_names, f"Expected type '{t}' not found in captures: {type_names}"
-
-
-def test_query_str_class_members_javascript():
-    """Validate QUERY_STR_CLASS_MEMBERS_JAVASCRIPT matches fields and methods."""
-    from buttercup.program_model.api.tree_sitter import QUERY_STR_CLASS_MEMBERS_JAVASCRIPT
-
-    tree = _parse(SAMPLE_TYPESCRIPT_CODE)
-    lang = get_language("typescript")
-    query = lang.query(QUERY_STR_CLASS_MEMBERS_JAVASCRIPT)
-    matches = query.matches(tree.root_node)
-
-    # Collect all captures by name
-    results: dict[str, list[str]] = {}
-    for _match_id, capture_dict in matches:
-        for capture_name, nodes in capture_dict.items():
-            for node in nodes:
-                results.setdefault(capture_name, []).append(node.text.decode())
-
-    print(f"Class member captures: {results}")
-
-    # Check field names captured
-    assert "name" in results, f"No 'name' captures found. Available: {list(results.keys())}"
-    field_names = results["name"]
-    print(f"Field names: {field_names}")
-    assert "connectionString" in field_names or "retryCount" in field_names, \
-        f"Expected field names not found: {field_names}"
-
-    # Check method names captured
-    assert "method_name" in results, f"No 'method_name' captures found. Available: {list(results.keys())}"
-    method_names = results["method_name"]
-    print(f"Method names in classes: {method_names}")
-    assert "getUserAsync" in method_names or "deleteUser" in method_names, \
-        f"Expected method names not found: {method_names}"
+    assert b"processData" in func_names, f"processData not found: {func_names}"
+    assert b"fuzz" in func_names, f"fuzz not found: {func_names}"
 
 
 def test_parse_tree_node_types():
@@ -252,8 +170,9 @@ class Foo {
 }
 """
     tree = _parse(code)
-    print("\n=== Parse tree for minimal TS class ===")
-    _print_tree(tree.root_node)
+    if os.environ.get("TS_TEST_DEBUG"):
+        print("\n=== Parse tree for minimal TS class ===")
+        _print_tree(tree.root_node)
 
     root = tree.root_node
     class_node = None
@@ -275,7 +194,7 @@ class Foo {
         f"class_body not found in class_declaration. Children: {[c.type for c in class_node.children]}"
 
     child_types = [c.type for c in body_node.children]
-    print(f"class_body children types: {child_types}")
+    logger.debug(f"class_body children types: {child_types}")
     assert "public_field_definition" in child_types, f"public_field_definition not found: {child_types}"
     assert "method_definition" in child_types, f"method_definition not found: {child_types}"
 
@@ -290,29 +209,23 @@ class Foo {
 }
 """
     tree = _parse(code)
-    root = tree.root_node
 
-    method_node = None
-
-    def find_method(node):
-        nonlocal method_node
-        if node.type == "method_definition":
-            method_node = node
-            return
-        for child in node.children:
-            find_method(child)
-
-    find_method(root)
+    method_node = _find_node(tree, "method_definition")
     assert method_node is not None, "method_definition not found"
 
+    # cursor.field_name reads the field from the cursor's own state, so the walk
+    # makes one FFI crossing per child instead of one field_name_for_child call
+    # per index
     field_names = set()
-    for i in range(method_node.child_count):
-        fn = method_node.field_name_for_child(i)
-        if fn:
-            field_names.add(fn)
-
-    print(f"method_definition field names: {field_names}")
-    print(f"method_definition children: {[(c.type, method_node.field_name_for_child(i)) for i, c in enumerate(method_node.children)]}")
+    cursor = method_node.walk()
+    if cursor.goto_first_child():
+        while True:
+            if cursor.field_name:
+                field_names.add(cursor.field_name)
+            if not cursor.goto_next_sibling():
+                break
+
+    logger.debug(f"method_definition field names: {field_names}")
 
     # Our query uses: name, parameters, body
     assert "name" in field_names, f"'name' field not found: {field_names}"
@@ -310,6 +310,27 @@ def mock_challenge_task_responses():
     }
 
 
+@pytest.fixture(scope="session")
+def init_openlit():
+    """Initialize openlit instrumentation once per test session.
+
+    Requested (via usefixtures) by the telemetry test modules only, so runs that
+    deselect or skip those tests never pay the openlit import or its global
+    instrumentation patching. openlit.init patches libraries globally, so
+    repeating it per test module would redo the whole setup; the sentinel also
+    keeps us from re-initializing when openlit was already set up elsewhere in
+    the process.
+    """
+    import openlit
+
+    if not getattr(openlit, "_initialized", False):
+        openlit.init(
+            disable_batch=True,
+            otlp_endpoint=None,
+        )
+        openlit._initialized = True
+
+
 def pytest_addoption(parser):
     parser.addoption(
         "--runintegration",
@@ -321,6 +342,7 @@ def pytest_addoption(parser):
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "integration: mark test as an integration test")
+    config.addinivalue_line("markers", "telemetry: mark test as requiring openlit/opentelemetry instrumentation")
 
 
 def pytest_collection_modifyitems(config, items):